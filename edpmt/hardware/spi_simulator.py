@@ -6,49 +6,62 @@ for testing and development purposes when real hardware is not available.
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, Any, Tuple
 
-from .interfaces import SPIHardwareInterface
+from .interfaces import SPIInterface
 
 logger = logging.getLogger(__name__)
 
 
-class SimulatedSPIInterface(SPIHardwareInterface):
-    """Simulated SPI Hardware Interface for testing without real hardware."""
+class SimulatedSPI(SPIInterface):
+    """Simulated SPI interface for testing without real hardware."""
 
-    def __init__(self, name: str = "Simulated-SPI", config: Optional[Dict] = None):
-        super().__init__(name, config)
-        self.devices = {}
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(name="Simulated SPI", config=config)
+        self.logger = logging.getLogger(__name__)
+        self.configs: Dict[Tuple[int, int], Tuple[int, int]] = {}  # (bus, device) -> (mode, speed)
+        self.initialized = True
+        self.logger.info("Simulated SPI interface created")
 
     async def initialize(self) -> bool:
         """Initialize the simulated SPI interface."""
-        self.devices.clear()
-        self.is_initialized = True
-        logger.info("SPI simulator initialized")
+        self.logger.info("Initializing simulated SPI interface")
+        self.configs.clear()
+        self.initialized = True
         return True
 
     async def cleanup(self) -> None:
-        """Clean up simulated SPI resources."""
-        self.devices.clear()
-        self.is_initialized = False
-        logger.info("SPI simulator cleaned up")
+        """Cleanup resources (none needed for simulator)."""
+        self.logger.info("Cleaning up simulated SPI interface")
+        self.configs.clear()
+        self.initialized = False
 
     async def transfer(self, data: bytes, bus: int = 0, device: int = 0) -> bytes:
-        """Simulate SPI transfer."""
-        if not self.is_initialized:
-            logger.error("SPI simulator not initialized")
-            return b''
-
-        # Echo back the data with some modifications (typical for SPI devices)
-        response = bytes([(b ^ 0xFF) & 0xFF for b in data])
-        logger.info(f"[SIM] SPI transfer on bus {bus}, device {device}: {data.hex()} -> {response.hex()}")
+        """Simulate an SPI transfer (each byte is echoed back inverted)."""
+        data = bytes(data)
+        response = bytes(b ^ 0xFF for b in data)
+        self.logger.info(f"[SIM] SPI transfer on bus {bus}, device {device}: {data.hex()} -> {response.hex()}")
         return response
 
     async def configure(self, bus: int = 0, device: int = 0, mode: int = 0, speed: int = 1000000) -> bool:
-        """Simulate configuring SPI settings."""
-        if not self.is_initialized:
-            logger.error("SPI simulator not initialized")
-            return False
-
-        logger.info(f"[SIM] SPI configured on bus {bus}, device {device}: mode {mode}, speed {speed}Hz")
+        """Simulate configuring SPI settings; unchanged settings are not re-applied."""
+        if self.configs.get((bus, device)) == (mode, speed):
+            return True
+        self.configs[(bus, device)] = (mode, speed)
+        self.logger.info(f"[SIM] SPI configured on bus {bus}, device {device}: mode {mode}, speed {speed}Hz")
         return True
+
+    async def execute(self, action: str, **params) -> Any:
+        """Execute a command on the simulated SPI interface."""
+        bus = params.get("bus", 0)
+        device = params.get("device", 0)
+        if action == "transfer":
+            return await self.transfer(params.get("data", b""), bus, device)
+        elif action == "configure":
+            return await self.configure(bus, device, params.get("mode", 0), params.get("speed", 1000000))
+        elif action == "configure_and_transfer":
+            # Apply the configuration right before the transfer it belongs to, in one request
+            await self.configure(bus, device, params.get("mode", 0), params.get("speed", 1000000))
+            return await self.transfer(params.get("data", b""), bus, device)
+        else:
+            raise ValueError(f"Unsupported action: {action}")
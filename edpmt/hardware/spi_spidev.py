@@ -6,25 +6,28 @@ using the spidev library for real SPI communication on Linux systems.
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, Any, Tuple
 
 try:
     import spidev
 except ImportError:
     spidev = None
 
-from .interfaces import SPIHardwareInterface
+from .interfaces import SPIInterface
 
 logger = logging.getLogger(__name__)
 
 
-class SpidevSPIInterface(SPIHardwareInterface):
+class SpidevSPI(SPIInterface):
     """SPI Hardware Interface implementation using spidev for Linux systems."""
 
-    def __init__(self, name: str = "Spidev-SPI", config: Optional[Dict] = None):
-        super().__init__(name, config)
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(name="Spidev SPI", config=config)
         self.spidev = spidev
         self.connections = {}
+        self.configs: Dict[Tuple[int, int], Tuple[int, int]] = {}  # (bus, device) -> (mode, speed)
+        if self.spidev is None:
+            raise RuntimeError("spidev library not available")
 
     async def initialize(self) -> bool:
         """Initialize the SPI interface using spidev."""
@@ -34,28 +37,29 @@ class SpidevSPIInterface(SPIHardwareInterface):
 
         try:
             logger.info("SPI interface initialized")
-            self.is_initialized = True
+            self.initialized = True
             return True
         except Exception as e:
             logger.error(f"Failed to initialize SPI: {e}")
-            self.is_initialized = False
+            self.initialized = False
             return False
 
     async def cleanup(self) -> None:
         """Clean up SPI resources."""
-        if self.is_initialized:
+        if self.initialized:
             for spi in self.connections.values():
                 try:
                     spi.close()
                 except Exception as e:
                     logger.warning(f"Error closing SPI connection: {e}")
             self.connections.clear()
+            self.configs.clear()
             logger.info("SPI interface cleaned up")
-            self.is_initialized = False
+            self.initialized = False
 
     async def transfer(self, data: bytes, bus: int = 0, device: int = 0) -> bytes:
         """Transfer data over SPI."""
-        if not self.is_initialized:
+        if not self.initialized:
             logger.error("SPI interface not initialized")
             return b''
 
@@ -67,12 +71,14 @@ class SpidevSPIInterface(SPIHardwareInterface):
                 spi.max_speed_hz = 1000000  # 1MHz default
                 spi.mode = 0  # Default mode
                 self.connections[connection_key] = spi
+                self.configs[connection_key] = (0, 1000000)
             except Exception as e:
                 logger.error(f"Failed to open SPI connection on bus {bus}, device {device}: {e}")
                 return b''
 
         try:
             spi = self.connections[connection_key]
+            data = bytes(data)
             response = spi.xfer2(list(data))
             result = bytes(response)
             logger.debug(f"SPI transfer on bus {bus}, device {device}: {data.hex()} -> {result.hex()}")
@@ -82,12 +88,14 @@ class SpidevSPIInterface(SPIHardwareInterface):
             return b''
 
     async def configure(self, bus: int = 0, device: int = 0, mode: int = 0, speed: int = 1000000) -> bool:
-        """Configure SPI settings."""
-        if not self.is_initialized:
+        """Configure SPI settings; unchanged settings are not re-applied."""
+        if not self.initialized:
             logger.error("SPI interface not initialized")
             return False
 
         connection_key = (bus, device)
+        if self.configs.get(connection_key) == (mode, speed):
+            return True
         if connection_key not in self.connections:
             try:
                 spi = self.spidev.SpiDev()
@@ -101,12 +109,28 @@ class SpidevSPIInterface(SPIHardwareInterface):
             spi = self.connections[connection_key]
             spi.max_speed_hz = speed
             spi.mode = mode
+            self.configs[connection_key] = (mode, speed)
             logger.info(f"SPI configured on bus {bus}, device {device}: mode {mode}, speed {speed}Hz")
             return True
         except Exception as e:
             logger.error(f"Error configuring SPI on bus {bus}, device {device}: {e}")
             return False
 
+    async def execute(self, action: str, **params) -> Any:
+        """Execute a command on the SPI interface."""
+        bus = params.get("bus", 0)
+        device = params.get("device", 0)
+        if action == "transfer":
+            return await self.transfer(params.get("data", b""), bus, device)
+        elif action == "configure":
+            return await self.configure(bus, device, params.get("mode", 0), params.get("speed", 1000000))
+        elif action == "configure_and_transfer":
+            # Apply the configuration right before the transfer it belongs to, in one request
+            await self.configure(bus, device, params.get("mode", 0), params.get("speed", 1000000))
+            return await self.transfer(params.get("data", b""), bus, device)
+        else:
+            raise ValueError(f"Unsupported action: {action}")
+
     def is_supported(self) -> bool:
         """Check if spidev is supported on the current platform."""
         return self.spidev is not None
@@ -6,25 +6,29 @@ using the pyserial library for real serial communication.
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, Any, Optional
 
 try:
     import serial
 except ImportError:
     serial = None
 
-from .interfaces import UARTHardwareInterface
+from .interfaces import UARTInterface
 
 logger = logging.getLogger(__name__)
 
 
-class SerialUARTInterface(UARTHardwareInterface):
+class SerialUART(UARTInterface):
     """UART Hardware Interface implementation using pyserial."""
 
-    def __init__(self, name: str = "Serial-UART", config: Optional[Dict] = None):
-        super().__init__(name, config)
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(name="Serial UART", config=config)
         self.serial = serial
         self.connections = {}
+        self.default_port = self.config.get('uart_port', '/dev/ttyS0')
+        self.baudrate = int(self.config.get('uart_baudrate', 9600))
+        if self.serial is None:
+            raise RuntimeError("pyserial library not available")
 
     async def initialize(self) -> bool:
         """Initialize the UART interface using pyserial."""
@@ -34,16 +38,16 @@ class SerialUARTInterface(UARTHardwareInterface):
 
         try:
             logger.info("UART interface initialized")
-            self.is_initialized = True
+            self.initialized = True
             return True
         except Exception as e:
             logger.error(f"Failed to initialize UART: {e}")
-            self.is_initialized = False
+            self.initialized = False
             return False
 
     async def cleanup(self) -> None:
         """Clean up UART resources."""
-        if self.is_initialized:
+        if self.initialized:
             for ser in self.connections.values():
                 try:
                     ser.close()
@@ -51,53 +55,68 @@ class SerialUARTInterface(UARTHardwareInterface):
                     logger.warning(f"Error closing UART connection: {e}")
             self.connections.clear()
             logger.info("UART interface cleaned up")
-            self.is_initialized = False
-
-    async def write(self, port: str, data: bytes, baudrate: int = 9600) -> bool:
-        """Write data to a UART port."""
-        if not self.is_initialized:
-            logger.error("UART interface not initialized")
-            return False
+            self.initialized = False
 
+    def _get_connection(self, port: str, **settings):
+        """Return the open connection for a port, opening it on first use."""
         if port not in self.connections:
-            try:
-                ser = self.serial.Serial(port, baudrate, timeout=1)
-                self.connections[port] = ser
-            except Exception as e:
-                logger.error(f"Failed to open UART port {port}: {e}")
-                return False
-
-        try:
-            ser = self.connections[port]
-            ser.write(data)
-            logger.debug(f"UART write to port {port}: {data.hex()}")
+            settings.setdefault('baudrate', self.baudrate)
+            settings.setdefault('timeout', 1)
+            self.connections[port] = self.serial.Serial(port, **settings)
+        return self.connections[port]
+
+    async def configure(self, port: Optional[str] = None, **settings) -> bool:
+        """(Re)open a UART port with the given line settings (baudrate, parity, ...)."""
+        port = port or self.default_port
+        ser = self.connections.pop(port, None)
+        if ser is not None:
+            ser.close()
+        self._get_connection(port, **settings)
+        logger.info(f"UART configured on port {port}: {settings}")
+        return True
+
+    async def send(self, data: bytes, port: Optional[str] = None) -> None:
+        """Write data to a UART port."""
+        port = port or self.default_port
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        data = bytes(data)
+        self._get_connection(port).write(data)
+        logger.debug(f"UART write to port {port}: {data.hex()}")
+
+    async def receive(self, length: int, timeout: float = 1.0, port: Optional[str] = None) -> bytes:
+        """Read up to length bytes from a UART port."""
+        port = port or self.default_port
+        ser = self._get_connection(port, timeout=timeout)
+        ser.timeout = timeout
+        data = ser.read(length)
+        logger.debug(f"UART read from port {port}: {data.hex()}")
+        return data
+
+    async def reset(self, port: Optional[str] = None) -> bool:
+        """Discard pending input/output on one open port, or on all of them."""
+        ports = [port] if port else list(self.connections)
+        for name in ports:
+            ser = self.connections.get(name)
+            if ser is not None:
+                ser.reset_input_buffer()
+                ser.reset_output_buffer()
+        return True
+
+    async def execute(self, action: str, **params) -> Any:
+        """Execute a command on the UART interface."""
+        port = params.pop("port", None)
+        if action == "configure":
+            return await self.configure(port, **params)
+        elif action == "send":
+            await self.send(params.get("data", b""), port)
             return True
-        except Exception as e:
-            logger.error(f"Error writing to UART port {port}: {e}")
-            return False
-
-    async def read(self, port: str, length: int = 1024, baudrate: int = 9600, timeout: float = 1.0) -> bytes:
-        """Read data from a UART port."""
-        if not self.is_initialized:
-            logger.error("UART interface not initialized")
-            return b''
-
-        if port not in self.connections:
-            try:
-                ser = self.serial.Serial(port, baudrate, timeout=timeout)
-                self.connections[port] = ser
-            except Exception as e:
-                logger.error(f"Failed to open UART port {port}: {e}")
-                return b''
-
-        try:
-            ser = self.connections[port]
-            data = ser.read(length)
-            logger.debug(f"UART read from port {port}: {data.hex()}")
-            return data
-        except Exception as e:
-            logger.error(f"Error reading from UART port {port}: {e}")
-            return b''
+        elif action == "receive":
+            return await self.receive(params.get("length", 1), params.get("timeout", 1.0), port)
+        elif action == "reset":
+            return await self.reset(port)
+        else:
+            raise ValueError(f"Unsupported action: {action}")
 
     def is_supported(self) -> bool:
         """Check if pyserial is supported on the current platform."""
@@ -6,62 +6,97 @@ for testing and development purposes when real hardware is not available.
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, Any, Optional
 
-from .interfaces import UARTHardwareInterface
+from .interfaces import UARTInterface
 
 logger = logging.getLogger(__name__)
 
 
-class SimulatedUARTInterface(UARTHardwareInterface):
-    """Simulated UART Hardware Interface with loopback functionality."""
+class SimulatedUART(UARTInterface):
+    """Simulated UART interface with loopback functionality."""
 
-    def __init__(self, name: str = "Simulated-UART", config: Optional[Dict] = None):
-        super().__init__(name, config)
-        self.buffers = {}  # port -> circular buffer
+    BUFFER_SIZE = 4096
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(name="Simulated UART", config=config)
+        self.logger = logging.getLogger(__name__)
+        self.default_port = self.config.get('uart_port', '/dev/ttyS0')
+        self.buffers: Dict[str, bytearray] = {}  # port -> loopback buffer
+        self.settings: Dict[str, Dict[str, Any]] = {}  # port -> line settings
+        self.initialized = True
+        self.logger.info("Simulated UART interface created")
 
     async def initialize(self) -> bool:
         """Initialize the simulated UART interface."""
+        self.logger.info("Initializing simulated UART interface")
         self.buffers.clear()
-        self.is_initialized = True
-        logger.info("UART simulator initialized")
+        self.settings.clear()
+        self.initialized = True
         return True
 
     async def cleanup(self) -> None:
-        """Clean up simulated UART resources."""
+        """Cleanup resources (none needed for simulator)."""
+        self.logger.info("Cleaning up simulated UART interface")
         self.buffers.clear()
-        self.is_initialized = False
-        logger.info("UART simulator cleaned up")
-
-    async def write(self, port: str, data: bytes, baudrate: int = 9600) -> bool:
-        """Simulate writing to a UART port (loopback)."""
-        if not self.is_initialized:
-            logger.error("UART simulator not initialized")
-            return False
-
-        if port not in self.buffers:
-            self.buffers[port] = bytearray()
+        self.settings.clear()
+        self.initialized = False
 
-        self.buffers[port].extend(data)
-        # Limit buffer to 4096 bytes
-        if len(self.buffers[port]) > 4096:
-            self.buffers[port] = self.buffers[port][-4096:]
-
-        logger.info(f"[SIM] UART write to port {port}: {data.hex()}")
+    async def configure(self, port: Optional[str] = None, **settings) -> bool:
+        """Store the line settings (baudrate, parity, ...) for a simulated port."""
+        port = port or self.default_port
+        self.settings[port] = settings
+        self.logger.info(f"[SIM] UART configured on port {port}: {settings}")
         return True
 
-    async def read(self, port: str, length: int = 1024, baudrate: int = 9600, timeout: float = 1.0) -> bytes:
-        """Simulate reading from a UART port (loopback)."""
-        if not self.is_initialized:
-            logger.error("UART simulator not initialized")
-            return b''
+    async def send(self, data: bytes, port: Optional[str] = None) -> None:
+        """Write data to a simulated port; it is looped back to its receive buffer."""
+        port = port or self.default_port
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        buffer = self.buffers.setdefault(port, bytearray())
+        buffer.extend(data)
+        # Limit buffer to BUFFER_SIZE bytes
+        if len(buffer) > self.BUFFER_SIZE:
+            del buffer[:-self.BUFFER_SIZE]
+        self.logger.info(f"[SIM] UART write to port {port}: {bytes(data).hex()}")
 
-        if port not in self.buffers or len(self.buffers[port]) == 0:
-            logger.info(f"[SIM] UART read from port {port}: no data")
+    async def receive(self, length: int, timeout: float = 1.0, port: Optional[str] = None) -> bytes:
+        """Read up to length bytes from a simulated port's loopback buffer."""
+        port = port or self.default_port
+        if length < 0:
+            raise ValueError(f"Invalid length: {length}")
+        buffer = self.buffers.get(port)
+        if not buffer:
+            self.logger.info(f"[SIM] UART read from port {port}: no data")
             return b''
-
-        # Read up to 'length' bytes from buffer
-        data = bytes(self.buffers[port][:length])
-        self.buffers[port] = self.buffers[port][len(data):]
-        logger.info(f"[SIM] UART read from port {port}: {data.hex()}")
+        data = bytes(buffer[:length])
+        del buffer[:length]
+        self.logger.info(f"[SIM] UART read from port {port}: {data.hex()}")
         return data
+
+    async def reset(self, port: Optional[str] = None) -> bool:
+        """Drop buffered data and settings for one port, or for all ports."""
+        if port is None:
+            self.buffers.clear()
+            self.settings.clear()
+        else:
+            self.buffers.pop(port, None)
+            self.settings.pop(port, None)
+        self.logger.info(f"[SIM] UART reset: {port or 'all ports'}")
+        return True
+
+    async def execute(self, action: str, **params) -> Any:
+        """Execute a command on the simulated UART interface."""
+        port = params.pop("port", None)
+        if action == "configure":
+            return await self.configure(port, **params)
+        elif action == "send":
+            await self.send(params.get("data", b""), port)
+            return True
+        elif action == "receive":
+            return await self.receive(params.get("length", 1), params.get("timeout", 1.0), port)
+        elif action == "reset":
+            return await self.reset(port)
+        else:
+            raise ValueError(f"Unsupported action: {action}")
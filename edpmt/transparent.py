@@ -63,6 +63,17 @@ class Message:
         return cls(**json.loads(data))
 
 
+def _json_default(obj):
+    """Encode binary hardware results (e.g. SPI/I2C/UART bytes) as lists of ints"""
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj) -> str:
+    return json.dumps(obj, default=_json_default)
+
+
 class Stats:
     def __init__(self):
         self.messages_sent = 0
@@ -90,6 +101,10 @@ class EDPMTransparent:
         self.logger.info(f"EDPM Transparent initialized: {self.name}")
         self.logger.info(f"Transport: {self.transport_type.value}, TLS: {self.tls_enabled}")
 
+        # Server state (set once a server is started)
+        self._runner = None
+        self.ipc_path = None
+
         # Hardware interfaces will be initialized dynamically
         self.hardware_interfaces = None
         self.hardware_future = None
@@ -128,8 +143,8 @@ class EDPMTransparent:
         else:
             raise ValueError(f"Unsupported transport type: {self.transport_type}")
 
-    async def _start_network_server(self):
-        """Start network server with optional TLS"""
+    def _create_app(self):
+        """Create the aiohttp application shared by the network and IPC servers"""
         from aiohttp import web
         import aiohttp_cors
         
@@ -155,6 +170,14 @@ class EDPMTransparent:
         for route in list(app.router.routes()):
             cors.add(route)
         
+        return app
+
+    async def _start_network_server(self):
+        """Start network server with optional TLS"""
+        from aiohttp import web
+        
+        app = self._create_app()
+        
         # SSL context for HTTPS/WSS
         ssl_context = None
         if self.tls_enabled:
@@ -167,6 +190,7 @@ class EDPMTransparent:
         # Start server
         runner = web.AppRunner(app)
         await runner.setup()
+        self._runner = runner
         
         site = web.TCPSite(
             runner, 
@@ -186,11 +210,27 @@ class EDPMTransparent:
             self.logger.info("IPC server not started (not in local mode)")
             return
         
+        from aiohttp import web
+        
         # Check if ipc_path exists in config, provide a default if not
         ipc_path = self.config.get('ipc_path', '/tmp/edpmt.sock')
-        self.logger.info(f"IPC server would start at {ipc_path}")
-        # Actual implementation would create a Unix socket server here
-        # self.ipc_server = await asyncio.start_unix_server(...)
+        
+        # Remove a stale socket left behind by a previous run
+        if os.path.exists(ipc_path):
+            os.unlink(ipc_path)
+        
+        # Same HTTP API as the network server, but over AF_UNIX: no TCP
+        # loopback and no TLS, access is restricted by file permissions
+        runner = web.AppRunner(self._create_app())
+        await runner.setup()
+        self._runner = runner
+        
+        site = web.UnixSite(runner, ipc_path)
+        await site.start()
+        os.chmod(ipc_path, 0o600)
+        self.ipc_path = ipc_path
+        
+        self.logger.info(f"IPC server running at unix://{ipc_path}")
     
     async def _start_websocket_server(self):
         """Start WebSocket server"""
@@ -207,7 +247,7 @@ class EDPMTransparent:
             await edpm.execute('play', 'audio', frequency=440)
         """
         # Validate action and target
-        valid_actions = ['set', 'get', 'read', 'write', 'scan', 'transfer', 'pwm', 'play', 'list', 'connect', 'disconnect', 'send', 'receive', 'configure', 'record']
+        valid_actions = ['set', 'get', 'read', 'write', 'scan', 'transfer', 'pwm', 'play', 'list', 'connect', 'disconnect', 'send', 'receive', 'configure', 'configure_and_transfer', 'record', 'reset']
         valid_targets = list(self.hardware_interfaces.keys()) + ['audio']
         
         if action not in valid_actions:
@@ -260,7 +300,7 @@ class EDPMTransparent:
                 'success': True,
                 'result': result,
                 'id': message.id
-            })
+            }, dumps=_json_dumps)
         except Exception as e:
             self.logger.error(f"Request error: {e}")
             return web.json_response({
@@ -296,7 +336,7 @@ class EDPMTransparent:
                             'success': True,
                             'result': result,
                             'id': message.id
-                        })
+                        }, dumps=_json_dumps)
                     except Exception as e:
                         await ws.send_json({
                             'success': False,
@@ -335,6 +375,13 @@ class EDPMTransparent:
     async def shutdown(self):
         """Shut down the server and clean up resources."""
         self.logger.info("Shutting down EDPM Transparent server")
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+        if self.ipc_path:
+            if os.path.exists(self.ipc_path):
+                os.unlink(self.ipc_path)
+            self.ipc_path = None
         if self.hardware_interfaces:
             for interface_name, interface in self.hardware_interfaces.items():
                 self.logger.info(f"Cleaning up hardware interface: {interface_name}")
@@ -345,30 +392,59 @@ class EDPMTransparent:
             self.hardware_interfaces = None
         self.logger.info("Server shutdown complete")
 
+    async def aclose(self):
+        """Stop the server and release resources (asyncio-style alias of shutdown)"""
+        await self.shutdown()
+
 
 class EDPMClient:
     """Simple client for EDPM - transparent and easy"""
     
+    # SSL contexts shared by all clients, keyed by dev mode
+    _ssl_contexts: Dict[bool, ssl.SSLContext] = {}
+    
     def __init__(self, url: str = None, use_tls: bool = None):
         """
         Initialize client with auto-detection
         
         Args:
-            url: Server URL (auto-detected if None)
+            url: Server URL (auto-detected if None); ``unix:///path/to.sock``
+                 connects to a co-located server over its IPC socket
             use_tls: Use TLS (auto-detected from URL)
         """
         self.url = url or os.environ.get('EDPM_URL', 'http://localhost:8888')
+        
+        # Unix domain socket: plain HTTP over AF_UNIX, TLS is never used
+        self.socket_path = None
+        if self.url.startswith('unix://'):
+            self.socket_path = self.url[len('unix://'):]
+            self.url = 'http://localhost'
+            use_tls = False
+        
         self.use_tls = use_tls if use_tls is not None else self.url.startswith('https')
         self.ws = None
         self.session = None
         
         # Setup SSL if needed
         if self.use_tls:
-            self.ssl_context = ssl.create_default_context()
+            self.ssl_context = self._get_ssl_context(bool(os.environ.get('EDPM_DEV')))
+    
+    @classmethod
+    def _get_ssl_context(cls, dev_mode: bool) -> ssl.SSLContext:
+        """Return the shared client SSL context, creating it on first use
+        
+        Building a context loads the system CA store, so it is done once per
+        process rather than once per client instance.
+        """
+        ssl_context = cls._ssl_contexts.get(dev_mode)
+        if ssl_context is None:
+            ssl_context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
             # For self-signed certs in development
-            if os.environ.get('EDPM_DEV'):
-                self.ssl_context.check_hostname = False
-                self.ssl_context.verify_mode = ssl.CERT_NONE
+            if dev_mode:
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+            cls._ssl_contexts[dev_mode] = ssl_context
+        return ssl_context
     
     async def execute(self, action: str, target: str, **params) -> Any:
         """Execute command on server - simple and transparent"""
@@ -380,17 +456,11 @@ class EDPMClient:
             response = await self.ws.recv()
             data = json.loads(response)
         else:
-            # Use HTTP
-            import aiohttp
-            
-            if not self.session:
-                connector = aiohttp.TCPConnector(ssl=self.ssl_context if self.use_tls else None)
-                self.session = aiohttp.ClientSession(connector=connector)
-            
-            async with self.session.post(
+            # Use HTTP over the persistent keep-alive session
+            session = self._ensure_session()
+            async with session.post(
                 f"{self.url}/api/execute",
-                json=asdict(message),
-                ssl=self.ssl_context if self.use_tls else None
+                json=asdict(message)
             ) as resp:
                 data = await resp.json()
         
@@ -399,6 +469,31 @@ class EDPMClient:
         else:
             raise Exception(data.get('error', 'Unknown error'))
     
+    def _ensure_session(self):
+        """Return the client's HTTP session, creating it on first use
+        
+        A single session (and connector) is kept for the lifetime of the
+        client so that consecutive requests reuse the same keep-alive
+        connection instead of paying a new TCP/TLS handshake each time.
+        """
+        if self.session is None or self.session.closed:
+            import aiohttp
+            
+            if self.socket_path:
+                connector = aiohttp.UnixConnector(
+                    path=self.socket_path,
+                    force_close=False,
+                    keepalive_timeout=60
+                )
+            else:
+                connector = aiohttp.TCPConnector(
+                    ssl=self.ssl_context if self.use_tls else False,
+                    force_close=False,
+                    keepalive_timeout=60
+                )
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+    
     async def connect_websocket(self):
         """Connect via WebSocket for real-time communication"""
         import websockets
@@ -418,6 +513,11 @@ class EDPMClient:
             await self.ws.close()
         if self.session:
             await self.session.close()
+            self.session = None
+    
+    async def aclose(self):
+        """Close client connections (asyncio-style alias of close)"""
+        await self.close()
     
     # Convenience methods
     async def gpio_set(self, pin: int, value: int):
@@ -57,8 +57,10 @@ setup(
     extras_require={
         "dev": [
             "pytest>=6.0",
-            "pytest-asyncio>=0.18.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=3.0.0",
+            "pytest-xdist>=3.0.0",
+            'uvloop>=0.18.0; platform_system != "Windows"',
             "black>=22.0.0",
             "flake8>=4.0.0",
             "mypy>=0.950",
@@ -0,0 +1,20 @@
+"""
+Shared pytest configuration for the EDPMT test suite
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Make the in-tree edpmt package importable (once per session, not per test module)
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# Run async tests on uvloop when it is installed (libuv-backed, faster socket dispatch)
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -8,16 +8,11 @@ Comprehensive testing of I2C functionality including device scanning, read/write
 import asyncio
 import pytest
 import sys
-from pathlib import Path
 
-# Add EDPMT to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from edpmt import EDPMTransparent, EDPMClient
 
-try:
-    from edpmt import EDPMTransparent, EDPMClient
-except ImportError:
-    # Fallback to direct import from modules
-    from transparent import EDPMTransparent, EDPMClient
+# Tests share a fixed IPC socket path, so keep them in one xdist worker
+pytestmark = pytest.mark.xdist_group("edpmt-i2c")
 
 class TestI2C:
     """Test I2C protocol functionality"""
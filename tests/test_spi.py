@@ -6,24 +6,91 @@ Comprehensive testing of SPI functionality including device communication and da
 """
 
 import asyncio
+import functools
+import logging
+import os
 import pytest
+import pytest_asyncio
+import struct
 import time
 import sys
-from pathlib import Path
 
-# Add EDPMT to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from edpmt import EDPMTransparent, EDPMClient
 
 try:
-    from edpmt import EDPMTransparent, EDPMClient
+    import uvloop
 except ImportError:
-    # Fallback to direct import from modules
-    from transparent import EDPMTransparent, EDPMClient
+    uvloop = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Failures the simulation harness is expected to produce (server unreachable,
+# request timeout, rejected parameters); anything else is a real test failure.
+# aiohttp connection errors derive from OSError.
+_EXPECTED = (OSError, TimeoutError, ValueError)
+
+# SPI flash command frames (JEDEC opcodes)
+_READ_ID = b'\x9f\x00\x00\x00'
+_READ_STATUS = b'\x05\x00'
+_WRITE_ENABLE = b'\x06'
+
+# MCP3008 reference voltage
+_ADC_VREF = 3.3
+
+def _decode_mcp3008(frames):
+    """Decode 10-bit MCP3008 samples from 3-byte transfer responses
+    
+    Returns (values, voltages); vectorised with NumPy when it is installed.
+    """
+    raw = b''.join(bytes(frame[1:3]) for frame in frames)
+    if np is not None:
+        pairs = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 2)
+        values = ((pairs[:, 0] & 0x03).astype(np.uint16) << 8) | pairs[:, 1]
+        return values.tolist(), (values * (_ADC_VREF / 1023)).tolist()
+    values = [((hi & 0x03) << 8) | lo for hi, lo in struct.iter_unpack('>BB', raw)]
+    return values, [value * _ADC_VREF / 1023 for value in values]
+
+# Parameter sets shared by the parametrized tests and the manual runner
+_READ_LENGTHS = [1, 2, 4, 8, 16]
+_WRITE_DATA_SETS = [
+    [0xFF],
+    [0x00, 0xFF],
+    [0xAA, 0x55, 0xAA, 0x55],
+    list(range(16)),  # 0-15
+]
+_CONFIGURATIONS = [
+    {'mode': 0, 'speed': 1000000},
+    {'mode': 1, 'speed': 500000},
+    {'mode': 2, 'speed': 2000000},
+    {'mode': 3, 'speed': 1500000},
+]
+_INTEGRITY_PATTERNS = (
+    bytes(8),                   # All zeros
+    b'\xff' * 8,                # All ones
+    b'\xaa\x55' * 4,            # Alternating pattern
+    bytes(range(64)),           # Sequential numbers
+    b'\x5a\xa5\x3c\xc3' * 2,    # Complex pattern
+)
+
+# Each pytest-xdist worker starts its own server, so each gets its own IPC socket
+_IPC_PATH = f"/tmp/edpmt_spi_test_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}.sock"
+
+pytestmark = [
+    # All tests share the module-scoped server, so they must run on its event loop
+    pytest.mark.asyncio(loop_scope="module"),
+    # ...and in the same xdist worker (--dist=loadgroup)
+    pytest.mark.xdist_group("edpmt-spi"),
+]
 
 class TestSPI:
     """Test SPI protocol functionality"""
     
-    @pytest.fixture
+    @pytest_asyncio.fixture(scope="module", loop_scope="module")
     async def server_client(self):
         """Setup EDPMT server and client for testing"""
         server = EDPMTransparent(
@@ -32,27 +99,24 @@ class TestSPI:
                 'dev_mode': True,
                 'port': 8879,
                 'host': 'localhost',
-                'tls': True,
+                'tls': False,
                 'hardware_simulators': True,
-                'ipc_path': '/tmp/edpmt_spi_test.sock'
+                'ipc_path': _IPC_PATH
             }
         )
         
         server_task = asyncio.create_task(server.start_server())
         await asyncio.sleep(2)
         
-        client = EDPMClient(url="https://localhost:8879")
+        # Co-located server: talk over the IPC socket, not TLS on loopback
+        client = EDPMClient(url=f"unix://{_IPC_PATH}")
         await asyncio.sleep(1)
         
         yield server, client
         
         # Cleanup
-        if hasattr(client, 'close'):
-            await client.close()
-        if hasattr(server, 'stop'):
-            await server.stop()
-        elif hasattr(server, 'close'):
-            await server.close()
+        await client.aclose()
+        await server.aclose()
         server_task.cancel()
         try:
             await server_task
@@ -76,10 +140,11 @@ class TestSPI:
             assert result is not None
             print(f"SPI transfer result: {result}")
             
-        except Exception as e:
-            print(f"SPI basic transfer test failed (expected in simulation): {e}")
+        except _EXPECTED as e:
+            logger.debug("SPI basic transfer test failed (expected in simulation): %s", e)
     
-    async def test_spi_read_operations(self, server_client):
+    @pytest.mark.parametrize("length", _READ_LENGTHS)
+    async def test_spi_read_length(self, server_client, length):
         """Test SPI read operations"""
         server, client = server_client
         
@@ -91,76 +156,50 @@ class TestSPI:
             result = await client.execute('read', 'spi',
                                         bus=bus,
                                         device=device,
-                                        length=4)
+                                        length=length)
             assert result is not None
-            print(f"SPI read result: {result}")
-            
-            # Read with different lengths
-            for length in [1, 2, 4, 8, 16]:
-                result = await client.execute('read', 'spi',
-                                            bus=bus,
-                                            device=device,
-                                            length=length)
-                print(f"SPI read {length} bytes: {result}")
+            print(f"SPI read {length} bytes: {result}")
                 
-        except Exception as e:
-            print(f"SPI read test failed (expected in simulation): {e}")
+        except _EXPECTED as e:
+            logger.debug("SPI read test failed (expected in simulation): %s", e)
     
-    async def test_spi_write_operations(self, server_client):
+    @pytest.mark.parametrize("data", _WRITE_DATA_SETS)
+    async def test_spi_write_operations(self, server_client, data):
         """Test SPI write operations"""
         server, client = server_client
         
         bus = 0
         device = 0
         
-        test_data_sets = [
-            [0xFF],
-            [0x00, 0xFF],
-            [0xAA, 0x55, 0xAA, 0x55],
-            list(range(16))  # 0-15
-        ]
-        
-        for data in test_data_sets:
-            try:
-                result = await client.execute('write', 'spi',
-                                            bus=bus,
-                                            device=device,
-                                            data=data)
-                print(f"SPI write {len(data)} bytes: {data} -> {result}")
-                
-            except Exception as e:
-                print(f"SPI write test failed (expected in simulation): {e}")
+        try:
+            result = await client.execute('write', 'spi',
+                                        bus=bus,
+                                        device=device,
+                                        data=data)
+            print(f"SPI write {len(data)} bytes: {data} -> {result}")
+            
+        except _EXPECTED as e:
+            logger.debug("SPI write test failed (expected in simulation): %s", e)
     
-    async def test_spi_configuration(self, server_client):
+    @pytest.mark.parametrize("config", _CONFIGURATIONS)
+    async def test_spi_configuration(self, server_client, config):
         """Test SPI configuration options"""
         server, client = server_client
         
         bus = 0
         device = 0
         
-        configurations = [
-            {'mode': 0, 'speed': 1000000},
-            {'mode': 1, 'speed': 500000},
-            {'mode': 2, 'speed': 2000000},
-            {'mode': 3, 'speed': 1500000},
-        ]
-        
-        for config in configurations:
-            try:
-                result = await client.execute('configure', 'spi',
-                                            bus=bus,
-                                            device=device,
-                                            **config)
-                print(f"SPI configured: mode={config['mode']}, speed={config['speed']}")
-                
-                # Test transfer with this configuration
-                await client.execute('transfer', 'spi',
-                                    bus=bus,
-                                    device=device,
-                                    data=[0x01, 0x02])
-                
-            except Exception as e:
-                print(f"SPI configuration test failed (expected in simulation): {e}")
+        try:
+            # Configure and transfer with this configuration in one round trip
+            result = await client.execute('configure_and_transfer', 'spi',
+                                        bus=bus,
+                                        device=device,
+                                        data=[0x01, 0x02],
+                                        **config)
+            print(f"SPI configured: mode={config['mode']}, speed={config['speed']} -> {result}")
+            
+        except _EXPECTED as e:
+            logger.debug("SPI configuration test failed (expected in simulation): %s", e)
     
     async def test_spi_adc_simulation(self, server_client):
         """Test SPI with ADC simulation (MCP3008)"""
@@ -174,22 +213,26 @@ class TestSPI:
             # Command format: [start_bit, SGL/DIFF, D2, D1, D0, X, X, X]
             # For channel 0 single-ended: 0b11000000 = 0xC0
             
-            for channel in range(8):  # MCP3008 has 8 channels
-                command = [0x01, (0x80 | (channel << 4)), 0x00]
-                
-                result = await client.execute('transfer', 'spi',
-                                            bus=bus,
-                                            device=device,
-                                            data=command)
-                
-                if result and len(result) >= 3:
-                    # Extract 10-bit value from result
-                    value = ((result[1] & 0x03) << 8) | result[2]
-                    voltage = value * 3.3 / 1023  # Convert to voltage
-                    print(f"ADC Channel {channel}: {value} ({voltage:.3f}V)")
+            # MCP3008 has 8 channels; sample them all concurrently
+            results = await asyncio.gather(*(
+                client.execute('transfer', 'spi',
+                               bus=bus,
+                               device=device,
+                               data=[0x01, (0x80 | (channel << 4)), 0x00])
+                for channel in range(8)
+            ))
+            
+            # Error envelopes come back as dicts; only decode raw frames
+            frames = [(channel, result) for channel, result in enumerate(results)
+                      if isinstance(result, (bytes, list)) and len(result) >= 3]
+            values, voltages = _decode_mcp3008([result for _, result in frames])
+            lines = [f"ADC Channel {channel}: {value} ({voltage:.3f}V)"
+                     for (channel, _), value, voltage in zip(frames, values, voltages)]
+            if lines:
+                print('\n'.join(lines))
                 
-        except Exception as e:
-            print(f"SPI ADC simulation test failed (expected in simulation): {e}")
+        except _EXPECTED as e:
+            logger.debug("SPI ADC simulation test failed (expected in simulation): %s", e)
     
     async def test_spi_flash_simulation(self, server_client):
         """Test SPI Flash memory operations"""
@@ -197,62 +240,57 @@ class TestSPI:
         
         bus = 0
         device = 1  # Different device
+        lines = []
         
         try:
             # Read Flash ID
-            read_id_cmd = [0x9F, 0x00, 0x00, 0x00]
             result = await client.execute('transfer', 'spi',
                                         bus=bus,
                                         device=device,
-                                        data=read_id_cmd)
-            print(f"Flash ID: {result}")
+                                        data=list(_READ_ID))
+            lines.append(f"Flash ID: {result}")
             
             # Read status register
-            read_status_cmd = [0x05, 0x00]
             result = await client.execute('transfer', 'spi',
                                         bus=bus,
                                         device=device,
-                                        data=read_status_cmd)
-            print(f"Flash Status: {result}")
+                                        data=list(_READ_STATUS))
+            lines.append(f"Flash Status: {result}")
             
             # Write enable
-            write_enable_cmd = [0x06]
             await client.execute('transfer', 'spi',
                                bus=bus,
                                device=device,
-                               data=write_enable_cmd)
+                               data=list(_WRITE_ENABLE))
             
-            # Page program (write data)
+            # Page program (write data): opcode + 24-bit big-endian address + data
             address = 0x000100  # Address to write
-            data_to_write = [0xAA, 0xBB, 0xCC, 0xDD]
-            program_cmd = [0x02,  # Page program command
-                          (address >> 16) & 0xFF,  # Address high
-                          (address >> 8) & 0xFF,   # Address mid
-                          address & 0xFF] + data_to_write  # Address low + data
+            data_to_write = b'\xaa\xbb\xcc\xdd'
+            program_cmd = b'\x02' + address.to_bytes(3, 'big') + data_to_write
             
             await client.execute('transfer', 'spi',
                                bus=bus,
                                device=device,
-                               data=program_cmd)
-            print(f"Flash programmed at 0x{address:06X}")
+                               data=list(program_cmd))
+            lines.append(f"Flash programmed at 0x{address:06X}")
             
             # Read data back
-            read_cmd = [0x03,  # Read command
-                       (address >> 16) & 0xFF,
-                       (address >> 8) & 0xFF,
-                       address & 0xFF] + [0x00] * len(data_to_write)
+            read_cmd = b'\x03' + address.to_bytes(3, 'big') + bytes(len(data_to_write))
             
             result = await client.execute('transfer', 'spi',
                                         bus=bus,
                                         device=device,
-                                        data=read_cmd)
+                                        data=list(read_cmd))
             
             if result and len(result) > 4:
                 read_back = result[4:]  # Skip command bytes
-                print(f"Flash read back: {read_back}")
+                lines.append(f"Flash read back: {read_back}")
             
-        except Exception as e:
-            print(f"SPI Flash simulation test failed (expected in simulation): {e}")
+        except _EXPECTED as e:
+            logger.debug("SPI Flash simulation test failed (expected in simulation): %s", e)
+        
+        if lines:
+            print('\n'.join(lines))
     
     async def test_spi_multiple_devices(self, server_client):
         """Test SPI with multiple devices on same bus"""
@@ -260,6 +298,7 @@ class TestSPI:
         
         bus = 0
         devices = [0, 1, 2]  # Test multiple chip selects
+        lines = []
         
         for device in devices:
             try:
@@ -268,12 +307,15 @@ class TestSPI:
                                             bus=bus,
                                             device=device,
                                             data=[0x01, 0x02])
-                print(f"Device {device} response: {result}")
+                lines.append(f"Device {device} response: {result}")
                 
                 await asyncio.sleep(0.01)  # Small delay between devices
                 
-            except Exception as e:
-                print(f"SPI device {device} test failed (expected in simulation): {e}")
+            except _EXPECTED as e:
+                logger.debug("SPI device %s test failed (expected in simulation): %s", device, e)
+        
+        if lines:
+            print('\n'.join(lines))
     
     async def test_spi_performance(self, server_client):
         """Test SPI performance and timing"""
@@ -284,16 +326,22 @@ class TestSPI:
         test_data = [0xFF, 0x00, 0xAA, 0x55]
         iterations = 50
         
+        # One-shot capability probe keeps the timed loop free of exception handling
+        try:
+            await client.execute('transfer', 'spi',
+                               bus=bus,
+                               device=device,
+                               data=test_data)
+        except _EXPECTED as e:
+            pytest.skip(f"SPI simulator unavailable: {e}")
+        
         start_time = time.time()
         
         for i in range(iterations):
-            try:
-                await client.execute('transfer', 'spi',
-                                   bus=bus,
-                                   device=device,
-                                   data=test_data)
-            except Exception:
-                pass  # Expected in simulation
+            await client.execute('transfer', 'spi',
+                               bus=bus,
+                               device=device,
+                               data=test_data)
         
         end_time = time.time()
         duration = end_time - start_time
@@ -302,31 +350,23 @@ class TestSPI:
         print(f"SPI transfer rate: {rate:.2f} transfers/second")
         assert duration < 30.0  # Should complete reasonably quickly
     
-    async def test_spi_data_integrity(self, server_client):
+    @pytest.mark.parametrize("pattern", _INTEGRITY_PATTERNS)
+    async def test_spi_data_integrity(self, server_client, pattern):
         """Test SPI data integrity with various patterns"""
         server, client = server_client
         
         bus = 0
         device = 0
         
-        test_patterns = [
-            [0x00] * 8,           # All zeros
-            [0xFF] * 8,           # All ones
-            [0xAA, 0x55] * 4,     # Alternating pattern
-            list(range(256))[:64], # Sequential numbers
-            [0x5A, 0xA5, 0x3C, 0xC3] * 2,  # Complex pattern
-        ]
-        
-        for i, pattern in enumerate(test_patterns):
-            try:
-                result = await client.execute('transfer', 'spi',
-                                            bus=bus,
-                                            device=device,
-                                            data=pattern)
-                print(f"Pattern {i+1}: {len(pattern)} bytes -> {type(result)}")
-                
-            except Exception as e:
-                print(f"SPI pattern {i+1} test failed (expected in simulation): {e}")
+        try:
+            result = await client.execute('transfer', 'spi',
+                                        bus=bus,
+                                        device=device,
+                                        data=list(pattern))
+            print(f"Pattern: {len(pattern)} bytes -> {type(result)}")
+            
+        except _EXPECTED as e:
+            logger.debug("SPI pattern test failed (expected in simulation): %s", e)
     
     async def test_spi_error_handling(self, server_client):
         """Test SPI error handling"""
@@ -338,8 +378,8 @@ class TestSPI:
                                bus=99,  # Invalid bus
                                device=0,
                                data=[0x01])
-        except Exception as e:
-            print(f"Invalid bus handled: {e}")
+        except _EXPECTED as e:
+            logger.debug("Invalid bus handled: %s", e)
         
         # Test invalid device
         try:
@@ -347,8 +387,8 @@ class TestSPI:
                                bus=0,
                                device=99,  # Invalid device
                                data=[0x01])
-        except Exception as e:
-            print(f"Invalid device handled: {e}")
+        except _EXPECTED as e:
+            logger.debug("Invalid device handled: %s", e)
         
         # Test empty data
         try:
@@ -356,8 +396,8 @@ class TestSPI:
                                bus=0,
                                device=0,
                                data=[])  # Empty data
-        except Exception as e:
-            print(f"Empty data handled: {e}")
+        except _EXPECTED as e:
+            logger.debug("Empty data handled: %s", e)
         
         # Test excessive data
         try:
@@ -366,8 +406,8 @@ class TestSPI:
                                bus=0,
                                device=0,
                                data=large_data)
-        except Exception as e:
-            print(f"Large data handled: {e}")
+        except _EXPECTED as e:
+            logger.debug("Large data handled: %s", e)
 
 async def run_spi_tests():
     """Run all SPI tests manually"""
@@ -383,52 +423,70 @@ async def run_spi_tests():
             'dev_mode': True,
             'port': 8879,
             'host': 'localhost',
-            'tls': True,
-            'hardware_simulators': True
+            'tls': False,
+            'hardware_simulators': True,
+            'ipc_path': _IPC_PATH
         }
     )
     
     server_task = asyncio.create_task(server.start_server())
     await asyncio.sleep(2)
     
-    client = EDPMClient(url="https://localhost:8879")
+    client = EDPMClient(url=f"unix://{_IPC_PATH}")
     await asyncio.sleep(1)
     
     server_client = (server, client)
     
     tests = [
         ("SPI Basic Transfer", test_spi.test_spi_basic_transfer),
-        ("SPI Read Operations", test_spi.test_spi_read_operations),
-        ("SPI Write Operations", test_spi.test_spi_write_operations),
-        ("SPI Configuration", test_spi.test_spi_configuration),
+        *((f"SPI Read {length} bytes",
+           functools.partial(test_spi.test_spi_read_length, length=length))
+          for length in _READ_LENGTHS),
+        *((f"SPI Write {len(data)} bytes",
+           functools.partial(test_spi.test_spi_write_operations, data=data))
+          for data in _WRITE_DATA_SETS),
+        *((f"SPI Configuration mode {config['mode']}",
+           functools.partial(test_spi.test_spi_configuration, config=config))
+          for config in _CONFIGURATIONS),
         ("SPI ADC Simulation", test_spi.test_spi_adc_simulation),
         ("SPI Flash Simulation", test_spi.test_spi_flash_simulation),
         ("SPI Multiple Devices", test_spi.test_spi_multiple_devices),
         ("SPI Performance", test_spi.test_spi_performance),
-        ("SPI Data Integrity", test_spi.test_spi_data_integrity),
+        *((f"SPI Data Integrity pattern {i+1}",
+           functools.partial(test_spi.test_spi_data_integrity, pattern=pattern))
+          for i, pattern in enumerate(_INTEGRITY_PATTERNS)),
         ("SPI Error Handling", test_spi.test_spi_error_handling),
     ]
     
-    passed = 0
-    failed = 0
-    
-    for test_name, test_func in tests:
+    async def _run(test_name, test_func):
+        """Run one test, returning (name, outcome, error)"""
         try:
-            print(f"\n🧪 Running: {test_name}")
             await test_func(server_client)
-            print(f"✅ PASSED: {test_name}")
-            passed += 1
+            return test_name, 'passed', None
+        except pytest.skip.Exception as e:
+            return test_name, 'skipped', e
         except Exception as e:
-            print(f"❌ FAILED: {test_name} - {e}")
-            failed += 1
+            return test_name, 'failed', e
+    
+    # The tests share no mutable state (each passes explicit bus/device
+    # arguments), so they can all run concurrently against the one server
+    print(f"\n🧪 Running {len(tests)} tests concurrently")
+    results = await asyncio.gather(*(_run(name, func) for name, func in tests))
+    
+    for test_name, outcome, error in results:
+        if outcome == 'passed':
+            print(f"✅ PASSED: {test_name}")
+        elif outcome == 'skipped':
+            print(f"⏭️  SKIPPED: {test_name} - {error}")
+        else:
+            print(f"❌ FAILED: {test_name} - {error}")
+    
+    passed = sum(1 for _, outcome, _ in results if outcome == 'passed')
+    failed = sum(1 for _, outcome, _ in results if outcome == 'failed')
     
     # Cleanup
-    if hasattr(client, 'close'):
-        await client.close()
-    if hasattr(server, 'stop'):
-        await server.stop()
-    elif hasattr(server, 'close'):
-        await server.close()
+    await client.aclose()
+    await server.aclose()
     server_task.cancel()
     try:
         await server_task
@@ -453,7 +511,8 @@ async def run_spi_tests():
 
 if __name__ == "__main__":
     try:
-        success = asyncio.run(run_spi_tests())
+        runner = uvloop.run if uvloop is not None else asyncio.run
+        success = runner(run_spi_tests())
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\n👋 SPI tests interrupted by user")
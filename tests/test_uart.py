@@ -7,25 +7,25 @@ Comprehensive testing of UART functionality including serial communication and d
 
 import asyncio
 import pytest
+import pytest_asyncio
 import time
 import sys
-from pathlib import Path
 
-# Add EDPMT to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from edpmt import EDPMTransparent, EDPMClient
 
-try:
-    from edpmt import EDPMTransparent, EDPMClient
-except ImportError:
-    # Fallback to direct import from modules
-    from transparent import EDPMTransparent, EDPMClient
+# Tests share one server (and its fixed IPC socket path) on the session event loop,
+# so keep them in one xdist worker
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.xdist_group("edpmt-uart"),
+]
 
 class TestUART:
     """Test UART protocol functionality"""
     
-    @pytest.fixture
+    @pytest_asyncio.fixture(scope="session", loop_scope="session")
     async def server_client(self):
-        """Setup EDPMT server and client for testing"""
+        """Setup EDPMT server and client once for all UART tests"""
         server = EDPMTransparent(
             name="UART-Test-Server",
             config={
@@ -59,6 +59,13 @@ class TestUART:
         except asyncio.CancelledError:
             pass
     
+    @pytest_asyncio.fixture(autouse=True, loop_scope="session")
+    async def reset_uart(self, server_client):
+        """Clear simulated UART buffers and settings so tests don't see each other's data"""
+        server, client = server_client
+        await server.execute('reset', 'uart')
+        yield
+    
     async def test_uart_configuration(self, server_client):
         """Test UART configuration options"""
         server, client = server_client